@@ -1,10 +1,14 @@
 """Main BIDS architecture implementation."""
 import copy
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Union
 from warnings import warn
 
+import numpy as np
 import pandas as pd
 
 from bids_explorer.architecture.mixins import (
@@ -19,6 +23,29 @@ from bids_explorer.paths.query import BidsQuery
 from bids_explorer.utils.errors import merge_error_logs
 from bids_explorer.utils.parsing import parse_bids_filename
 
+_TEST_FILE_RE = re.compile(r"test", re.IGNORECASE)
+
+_CACHE_FILENAME = ".bids_explorer_cache.pkl"
+
+# Canonical `sub/ses/datatype/filename` tail of a well-formed BIDS path.
+# Files matching this pattern are guaranteed to pass validate_bids_file
+# and can have their entities read straight from the capture groups,
+# skipping the per-file validation and parsing entirely.
+_CANONICAL_BIDS_RE = re.compile(
+    r"^sub-(?P<subject>[a-zA-Z0-9]+)/"
+    r"ses-(?P<session>[a-zA-Z0-9]+)/"
+    r"(?P<datatype>[a-z0-9]+)/"
+    r"sub-(?P=subject)_ses-(?P=session)"
+    r"(?:_task-(?P<task>[a-zA-Z0-9]+))?"
+    r"(?:_acq-(?P<acquisition>[a-zA-Z0-9]+))?"
+    r"(?:_run-(?P<run>[a-zA-Z0-9]+))?"
+    r"(?:_recording-(?P<recording>[a-zA-Z0-9]+))?"
+    r"(?:_space-(?P<space>[a-zA-Z0-9]+))?"
+    r"(?:_desc-(?P<description>[a-zA-Z0-9]+))?"
+    r"_(?P<suffix>[a-zA-Z0-9]+)"
+    r"(?P<extension>\.[a-zA-Z0-9]+)$"
+)
+
 
 class BidsArchitecture(BidsArchitectureMixin):
     """Main class for handling BIDS directory structure.
@@ -45,6 +72,38 @@ class BidsArchitecture(BidsArchitectureMixin):
             List of run numbers present in the dataset.
     """
 
+    _database_keys = (
+        "inode",
+        "root",
+        "subject",
+        "session",
+        "datatype",
+        "task",
+        "run",
+        "acquisition",
+        "recording",
+        "description",
+        "suffix",
+        "extension",
+        "atime",
+        "mtime",
+        "ctime",
+        "filename",
+    )
+
+    _categorical_keys = (
+        "subject",
+        "session",
+        "datatype",
+        "task",
+        "run",
+        "acquisition",
+        "recording",
+        "description",
+        "suffix",
+        "extension",
+    )
+
     def __init__(  # noqa: D107
         self,
         root: Optional[Union[str, Path]] = None,
@@ -58,8 +117,10 @@ class BidsArchitecture(BidsArchitectureMixin):
         description: Optional[str] = None,
         suffix: Optional[str] = None,
         extension: Optional[str] = None,
+        use_cache: bool = False,
     ) -> None:
         self.root = Path(root) if root else None
+        self._use_cache = use_cache
         if root:
             self._path_handler = BidsQuery(
                 root=self.root,
@@ -74,13 +135,108 @@ class BidsArchitecture(BidsArchitectureMixin):
                 suffix=suffix,
                 extension=extension,
             )
-            self._database, self._errors = self.create_database()
         else:
             self._database = pd.DataFrame()
             self._errors = pd.DataFrame()
 
+    def _ensure_database(self) -> None:
+        """Scan the filesystem on first access to the database.
+
+        Construction only records the query; the walk itself is deferred
+        until something actually reads the database or the error log.
+        """
+        if not hasattr(self, "_database"):
+            cached = self._load_cached_database() if self._use_cache else None
+            if cached is not None:
+                self._database, self._errors = cached
+            else:
+                self._database, self._errors = self.create_database()
+                if self._use_cache:
+                    self._save_cached_database()
+
+    def _cache_key(self) -> tuple:
+        """Return the query parameters identifying a cached scan."""
+        return (
+            self._path_handler.subject,
+            self._path_handler.session,
+            self._path_handler.datatype,
+            self._path_handler.task,
+            self._path_handler.acquisition,
+            self._path_handler.run,
+            self._path_handler.recording,
+            self._path_handler.space,
+            self._path_handler.description,
+            self._path_handler.suffix,
+            self._path_handler.extension,
+        )
+
+    def _cache_is_stale(self, cache_mtime: float) -> bool:
+        """Check whether the tree changed since the cache was written.
+
+        Compares the root and first-level (subject) directory mtimes
+        against the cache file's mtime; deeper modifications that do not
+        touch those directories are not detected.
+
+        Args:
+            cache_mtime: Modification time of the cache file.
+
+        Returns:
+            bool: True if the cache must be discarded.
+        """
+        try:
+            if self.root.stat().st_mtime > cache_mtime:
+                return True
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if (
+                        entry.is_dir(follow_symlinks=False)
+                        and entry.stat().st_mtime > cache_mtime
+                    ):
+                        return True
+        except OSError:
+            return True
+        return False
+
+    def _load_cached_database(
+        self,
+    ) -> Optional[tuple[pd.DataFrame, pd.DataFrame]]:
+        """Load a previously scanned database from the on-disk cache.
+
+        Returns:
+            Optional[tuple[pd.DataFrame, pd.DataFrame]]: Cached
+                (database, error_log), or None if there is no usable
+                cache for this query.
+        """
+        cache_path = self.root / _CACHE_FILENAME
+        try:
+            cache_mtime = cache_path.stat().st_mtime
+        except OSError:
+            return None
+        if self._cache_is_stale(cache_mtime):
+            return None
+        try:
+            payload = pd.read_pickle(cache_path)
+        except Exception:
+            return None
+        if payload.get("query") != self._cache_key():
+            return None
+        return payload["database"], payload["errors"]
+
+    def _save_cached_database(self) -> None:
+        """Persist the scanned database next to the dataset root."""
+        payload = {
+            "query": self._cache_key(),
+            "database": self._database,
+            "errors": self._errors,
+        }
+        try:
+            pd.to_pickle(payload, self.root / _CACHE_FILENAME)
+        except OSError:
+            pass
+
     def __repr__(self) -> str:  # noqa: D105
-        if hasattr(self, "_database"):
+        if hasattr(self, "_database") or self.root:
+            self._ensure_database()
             return (
                 f"BidsArchitecture: {len(self._database)} files, "
                 f"{len(self._errors)} errors, "
@@ -106,27 +262,37 @@ class BidsArchitecture(BidsArchitectureMixin):
         return self.__repr__()
 
     def __len__(self) -> int:  # noqa: D105
+        self._ensure_database()
         return len(self._database)
 
     def __getitem__(self, index: int) -> pd.DataFrame:  # noqa: D105
+        self._ensure_database()
         return self._database.iloc[index]
 
     def __setitem__(self, index: int, value: pd.DataFrame) -> None:  # noqa: D105
         raise NotImplementedError("Setting items is not supported")
 
-    def __iter__(self) -> Iterator[pd.DataFrame]:
-        """Iterate over rows in the database."""
-        return self._database.iterrows()
+    def __iter__(self) -> Iterator[tuple[Any, pd.Series]]:
+        """Iterate over (index, row) pairs in the database.
+
+        Rows are materialized from `itertuples`, which walks the columns
+        once instead of boxing and dtype-checking each row the way
+        `iterrows` does.
+        """
+        self._ensure_database()
+        columns = self._database.columns
+        for row in self._database.itertuples(index=True, name=None):
+            yield row[0], pd.Series(row[1:], index=columns, name=row[0])
 
     def __add__(  # noqa: D105
         self,
         other: "BidsArchitecture",
     ) -> "BidsArchitecture":
+        self._ensure_database()
+        other._ensure_database()
         _ = prepare_for_operations(self, other)
-        non_duplicates = other._database.index.difference(self._database.index)
-        combined_db = pd.concat(
-            [self._database, other._database.loc[non_duplicates]]
-        )
+        combined_db = pd.concat([self._database, other._database])
+        combined_db = combined_db[~combined_db.index.duplicated(keep="first")]
         new_instance = BidsArchitecture()
         new_instance._database = combined_db
         new_instance._errors = merge_error_logs(self, other)
@@ -136,10 +302,13 @@ class BidsArchitecture(BidsArchitectureMixin):
         self,
         other: "BidsArchitecture",
     ) -> "BidsArchitecture":
+        self._ensure_database()
+        other._ensure_database()
         indices_other = prepare_for_operations(self, other)
-        remaining_indices = self._database.index.difference(indices_other)
         new_instance = BidsArchitecture()
-        new_instance._database = self._database.loc[remaining_indices]
+        new_instance._database = self._database[
+            ~self._index_membership(indices_other)
+        ]
         new_instance._errors = merge_error_logs(self, other)
         return new_instance
 
@@ -147,14 +316,35 @@ class BidsArchitecture(BidsArchitectureMixin):
         self,
         other: "BidsArchitecture",
     ) -> "BidsArchitecture":
+        self._ensure_database()
+        other._ensure_database()
         indices_other = prepare_for_operations(self, other)
-        common_indices = self._database.index.intersection(indices_other)
-
         new_instance = BidsArchitecture()
-        new_instance._database = self._database.loc[common_indices]
+        new_instance._database = self._database[
+            self._index_membership(indices_other)
+        ]
         new_instance._errors = merge_error_logs(self, other)
         return new_instance
 
+    def _index_membership(self, other_index: Any) -> np.ndarray:
+        """Boolean mask of rows whose index appears in `other_index`.
+
+        Uses numpy's sort-based membership over the raw index values.
+        The scanned index is sorted by inode, so membership resolves via
+        binary search instead of hashing every index entry.
+
+        Args:
+            other_index: Index, set, or array of index values.
+
+        Returns:
+            np.ndarray: Boolean mask aligned with `_database`.
+        """
+        if isinstance(other_index, set):
+            other_values = np.asarray(list(other_index))
+        else:
+            other_values = np.asarray(other_index)
+        return np.isin(self._database.index.to_numpy(), other_values)
+
     @property
     def database(self) -> pd.DataFrame:
         """Returns the BIDS dataset as a DataFrame.
@@ -171,10 +361,8 @@ class BidsArchitecture(BidsArchitectureMixin):
         This DataFrame serves as the core representation of the BIDS dataset
         and is used for all operations.
         """
-        if hasattr(self, "_database"):
-            return self._database
-        else:
-            return pd.DataFrame()
+        self._ensure_database()
+        return self._database
 
     @database.setter
     def database(self, value: pd.DataFrame) -> None:
@@ -190,10 +378,8 @@ class BidsArchitecture(BidsArchitectureMixin):
         This DataFrame contains information about files that failed validation
         during the database creation process.
         """
-        if hasattr(self, "_errors"):
-            return self._errors
-        else:
-            return pd.DataFrame()
+        self._ensure_database()
+        return self._errors
 
     @errors.setter
     def errors(self, value: pd.DataFrame) -> None:
@@ -202,6 +388,10 @@ class BidsArchitecture(BidsArchitectureMixin):
     def _get_unique_values(self, column: str) -> List[str]:
         """Get unique values from a database column.
 
+        Results are cached per column; the cache is dropped whenever
+        `_database` is rebound (e.g. by `select` or set operations), so
+        repeated property accesses only pay for one pass per column.
+
         Args:
             column: Name of the column to get unique values from.
 
@@ -210,21 +400,38 @@ class BidsArchitecture(BidsArchitectureMixin):
             values.
             Values are converted to strings and sorted.
         """
+        self._ensure_database()
+        if getattr(self, "_unique_cache_for", None) is not self._database:
+            self._unique_cache: Dict[str, List[str]] = {}
+            self._unique_cache_for = self._database
+
+        cached = self._unique_cache.get(column)
+        if cached is not None:
+            return cached
+
         if self._database.empty:
             return []
 
-        # Get unique values and convert to list for filtering
-        values = self._database[column].unique()
+        # Get unique values and convert to list for filtering. For
+        # categorical columns the distinct values are recovered from the
+        # integer codes, avoiding a hash pass over the objects.
+        column_data = self._database[column]
+        if isinstance(column_data.dtype, pd.CategoricalDtype):
+            codes = np.unique(column_data.cat.codes.to_numpy())
+            values = column_data.cat.categories[codes[codes >= 0]]
+        else:
+            values = column_data.dropna().unique()
 
-        # Filter out None, empty strings, and NaN values
+        # Missing values are already gone (dropped above, or excluded by
+        # the `codes >= 0` filter); only empty strings remain to filter.
         value_list = [
             str(elem)  # Convert all values to strings
             for elem in values
-            if pd.notna(elem)  # Handles both None and np.nan
-            and str(elem).strip() != ""  # Handles empty strings and whitespace
+            if str(elem).strip() != ""  # Handles empty strings and whitespace
         ]
 
-        return sorted(value_list)
+        self._unique_cache[column] = sorted(value_list)
+        return self._unique_cache[column]
 
     @property
     def subjects(self) -> List[str]:
@@ -327,109 +534,185 @@ class BidsArchitecture(BidsArchitectureMixin):
         if not self.root:
             raise ValueError("Root directory not set")
 
-        database_keys = [
-            "inode",
-            "root",
-            "subject",
-            "session",
-            "datatype",
-            "task",
-            "run",
-            "acquisition",
-            "recording",
-            "description",
-            "suffix",
-            "extension",
-            "atime",
-            "mtime",
-            "ctime",
-            "filename",
-        ]
+        rows: List[tuple] = []
+        error_rows: List[tuple] = []
 
-        data: Dict[str, List[Any]] = {key: [] for key in database_keys}
-        error_flags: Dict[str, List[Any]] = {
-            "filename": [],
-            "error_type": [],
-            "error_message": [],
-            "inode": [],
-        }
+        partitions = list(self._path_handler.generate_partitions())
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for partition_rows, partition_errors in executor.map(
+                self._scan_partition, partitions
+            ):
+                rows.extend(partition_rows)
+                error_rows.extend(partition_errors)
 
-        for file in self._path_handler.generate():
-            if "test" in file.name.lower():
-                continue
+        return self._create_dataframes(rows, error_rows)
+
+    def _scan_partition(
+        self, entries: Iterator[os.DirEntry]
+    ) -> tuple[List[tuple], List[tuple]]:
+        """Validate and parse one partition of the directory scan.
 
+        Runs in a worker thread; the GIL is released during the
+        underlying `scandir`/`stat` calls, so partitions of the tree are
+        crawled concurrently.
+
+        Args:
+            entries: Iterator of directory entries to process.
+
+        Returns:
+            tuple[List[tuple], List[tuple]]: Tuple containing
+                (file rows, error rows), one tuple per file.
+        """
+        records: List[tuple] = []
+        tails: List[str] = []
+        for entry in entries:
+            if _TEST_FILE_RE.search(entry.name):
+                continue
+            records.append((Path(entry.path), entry.stat()))
+            tails.append("/".join(entry.path.split(os.sep)[-4:]))
+
+        rows: List[tuple] = []
+        error_rows: List[tuple] = []
+        if not records:
+            return rows, error_rows
+
+        # One vectorized regex pass over all filenames in the partition;
+        # only non-canonical names take the per-file validation path.
+        extracted = pd.Series(tails).str.extract(_CANONICAL_BIDS_RE)
+        matched = extracted["subject"].notna().to_numpy()
+        entity_records = extracted.to_dict("records")
+
+        for i, (file, file_stats) in enumerate(records):
+            if matched[i]:
+                entities = {
+                    key: (None if pd.isna(value) else value)
+                    for key, value in entity_records[i].items()
+                }
+                rows.append(self._build_file_row(file, file_stats, entities))
+                continue
             try:
                 validate_bids_file(file)
                 entities = parse_bids_filename(file)
-                self._add_file_to_database(file, entities, data)
+                rows.append(self._build_file_row(file, file_stats, entities))
             except Exception as e:
-                self._add_error_to_log(file, e, error_flags)
+                error_rows.append(
+                    self._build_error_row(file, file_stats, e)
+                )
 
-        return self._create_dataframes(data, error_flags)
+        return rows, error_rows
 
-    def _add_file_to_database(
-        self, file: Path, entities: dict, data: Dict[str, List[Any]]
-    ) -> None:
-        """Add file information to database dictionary.
+    def _build_file_row(
+        self,
+        file: Path,
+        file_stats: os.stat_result,
+        entities: dict,
+    ) -> tuple:
+        """Build one database row as a tuple ordered like `_database_keys`.
 
         Args:
             file: Path object representing the file.
+            file_stats: Stat result gathered during the directory scan.
             entities: Dictionary containing parsed BIDS entities.
-            data: Dictionary to store file information.
-        """
-        # Add root separately since it's not in entities
-        data["root"].append(self.root)
 
-        # Add all other entities
-        for key in data.keys():
-            if key in ["atime", "mtime", "ctime", "filename", "root", "inode"]:
-                continue
-            data[key].append(entities.get(key))
-
-        file_stats = file.stat()
-        data["inode"].append(int(file_stats.st_ino))
-        data["atime"].append(int(file_stats.st_atime))
-        data["mtime"].append(int(file_stats.st_mtime))
-        data["ctime"].append(int(file_stats.st_ctime))
-        data["filename"].append(file)
+        Returns:
+            tuple: Row values ordered like `_database_keys`.
+        """
+        return (
+            file_stats.st_ino,
+            self.root,
+            entities.get("subject"),
+            entities.get("session"),
+            entities.get("datatype"),
+            entities.get("task"),
+            entities.get("run"),
+            entities.get("acquisition"),
+            entities.get("recording"),
+            entities.get("description"),
+            entities.get("suffix"),
+            entities.get("extension"),
+            file_stats.st_atime,
+            file_stats.st_mtime,
+            file_stats.st_ctime,
+            os.fspath(file),
+        )
 
-    def _add_error_to_log(
-        self, file: Path, error: Exception, error_flags: Dict[str, List[Any]]
-    ) -> None:
-        """Add error information to error log dictionary.
+    def _build_error_row(
+        self,
+        file: Path,
+        file_stats: os.stat_result,
+        error: Exception,
+    ) -> tuple:
+        """Build one error-log row as a tuple.
 
         Args:
             file: Path object representing the problematic file.
+            file_stats: Stat result gathered during the directory scan.
             error: Exception that was raised.
-            error_flags: Dictionary to store error information.
+
+        Returns:
+            tuple: (filename, error type, error message, inode) values.
         """
-        error_flags["filename"].append(file)
-        error_flags["error_type"].append(error.__class__.__name__)
-        error_flags["error_message"].append(str(error))
-        error_flags["inode"].append(file.stat().st_ino)
+        return (
+            os.fspath(file),
+            error.__class__.__name__,
+            str(error),
+            file_stats.st_ino,
+        )
 
     def _create_dataframes(
-        self, data: Dict[str, List[Any]], error_flags: Dict[str, List[Any]]
+        self, rows: List[tuple], error_rows: List[tuple]
     ) -> tuple[pd.DataFrame, pd.DataFrame]:
-        """Create DataFrames from collected data.
+        """Create DataFrames from collected rows.
+
+        Transposes the row tuples into columns in a single C-level pass
+        and gives the numeric columns typed numpy arrays up front so
+        pandas does not re-infer dtypes element by element.
 
         Args:
-            data: Dictionary containing file information.
-            error_flags: Dictionary containing error information.
+            rows: File rows ordered like `_database_keys`.
+            error_rows: Error rows (filename, type, message, inode).
 
         Returns:
             tuple[pd.DataFrame, pd.DataFrame]: Tuple containing
                                                (database, error_log).
         """
+        if rows:
+            data: Dict[str, Any] = dict(
+                zip(self._database_keys, zip(*rows))
+            )
+        else:
+            data = {key: [] for key in self._database_keys}
+        for key in ("inode", "atime", "mtime", "ctime"):
+            data[key] = np.asarray(data[key], dtype=np.int64)
+
+        error_keys = ("filename", "error_type", "error_message", "inode")
+        if error_rows:
+            error_flags: Dict[str, Any] = dict(
+                zip(error_keys, zip(*error_rows))
+            )
+        else:
+            error_flags = {key: [] for key in error_keys}
+
         data_df = pd.DataFrame(
-            data,
-            index=data["inode"],
-            columns=[key for key in data.keys() if key != "inode"],
+            {key: data[key] for key in self._database_keys if key != "inode"},
+            index=pd.Index(data["inode"], dtype="int64", copy=False),
         )
+        # BIDS entities are low-cardinality strings repeated across many
+        # rows; dictionary-encoding them shrinks memory and turns the
+        # comparisons in _create_mask into integer-code operations.
+        for key in self._categorical_keys:
+            data_df[key] = data_df[key].astype("category")
+        # Keep the inode index sorted so membership checks can use
+        # binary search instead of hashing.
+        data_df.sort_index(inplace=True)
         error_df = pd.DataFrame(
-            error_flags,
+            {
+                key: error_flags[key]
+                for key in error_flags.keys()
+                if key != "inode"
+            },
             index=error_flags["inode"],
-            columns=[key for key in error_flags.keys() if key != "inode"],
         )
         return data_df, error_df
 
@@ -467,13 +750,18 @@ class BidsArchitecture(BidsArchitectureMixin):
         if isinstance(stop, str):
             stop = int(stop)
 
-        dataframe_column = dataframe_column.apply(lambda s: int(s))
+        dataframe_column = pd.to_numeric(dataframe_column, errors="coerce")
+        if dataframe_column.isna().any():
+            raise ValueError(
+                "Column contains values that cannot be interpreted as "
+                "integers"
+            )
 
         if start is None or start == "*":
-            start = min(dataframe_column)
+            start = dataframe_column.min()
 
         if stop is None or stop == "*":
-            stop = max(dataframe_column) + 1
+            stop = dataframe_column.max() + 1
 
         return (start <= dataframe_column) & (dataframe_column < stop)
 
@@ -483,15 +771,25 @@ class BidsArchitecture(BidsArchitectureMixin):
         if not isinstance(value, (str, type(None))):
             value = str(value)
         locations_found = dataframe_column == value
-        if not any(locations_found):
+        if not locations_found.any():
             warn("No location corresponding found in the database")
-            locations_found.apply(lambda s: not (s))
         return locations_found
 
-    def _is_numerical(
-        self, dataframe_column: pd.core.series.Series
-    ) -> pd.core.series.Series:
-        return all(dataframe_column.apply(lambda x: str(x).isdigit()))
+    def _is_numerical(self, dataframe_column: pd.core.series.Series) -> bool:
+        if (
+            getattr(self, "_numerical_cache_for", None)
+            is not self._database
+        ):
+            self._numerical_cache: Dict[Any, bool] = {}
+            self._numerical_cache_for = self._database
+
+        cached = self._numerical_cache.get(dataframe_column.name)
+        if cached is None:
+            cached = bool(
+                dataframe_column.astype(str).str.fullmatch(r"\d+").all()
+            )
+            self._numerical_cache[dataframe_column.name] = cached
+        return cached
 
     def _interpret_string(
         self,
@@ -537,18 +835,47 @@ class BidsArchitecture(BidsArchitectureMixin):
         else:
             return self._get_single_loc(dataframe_column, value)
 
-    def _create_mask(self, **kwargs: str | list[str] | None) -> pd.Series:
+    def _to_numeric_column(self, key: str) -> np.ndarray:
+        """Get a column converted with `pd.to_numeric`, cached per column.
+
+        Repeated range selections on the same column (e.g. successive
+        `select(run=...)` calls) reuse the converted values instead of
+        re-parsing the whole column. The cache is dropped whenever
+        `_database` is rebound, mirroring `_get_unique_values`. Values
+        are kept as a bare ndarray so the range comparisons run as plain
+        numpy operations without re-wrapping a Series per call.
+
+        Args:
+            key: Name of the column to convert.
+
+        Returns:
+            np.ndarray: Column values coerced to numeric, NaN on failure.
+        """
+        if getattr(self, "_numeric_cache_for", None) is not self._database:
+            self._numeric_cache: Dict[str, np.ndarray] = {}
+            self._numeric_cache_for = self._database
+
+        cached = self._numeric_cache.get(key)
+        if cached is None:
+            cached = pd.to_numeric(
+                self._database[key], errors="coerce"
+            ).to_numpy()
+            self._numeric_cache[key] = cached
+        return cached
+
+    def _create_mask(self, **kwargs: str | list[str] | None) -> np.ndarray:
         """Create boolean mask for filtering DataFrame.
 
         Creates an optimized boolean mask for filtering the database based on
-        provided BIDS entities.
+        provided BIDS entities. Per-entity masks are combined with a
+        vectorized numpy AND rather than Python set intersections.
 
         Args:
             **kwargs: BIDS entities to filter by
                       (e.g., subject='01', session='1').
 
         Returns:
-            pd.Series: Boolean mask for filtering DataFrame.
+            np.ndarray: Boolean mask for filtering DataFrame.
 
         Raises:
             ValueError: If invalid selection keys are provided.
@@ -570,20 +897,23 @@ class BidsArchitecture(BidsArchitectureMixin):
         if invalid_keys:
             raise ValueError(f"Invalid selection keys: {invalid_keys}")
 
-        valid_inodes = set(self._database.index)
+        self._ensure_database()
+
+        mask = np.ones(len(self._database), dtype=bool)
 
         for key, value in kwargs.items():
+            if not mask.any():
+                # Nothing can match anymore; skip the remaining criteria.
+                return mask
+
             if value is None:
                 continue
 
             if value == "":
-                return pd.Series(False, index=self._database.index)
+                return np.zeros(len(self._database), dtype=bool)
 
             if isinstance(value, list):
-                matching_inodes = set(
-                    self._database[self._database[key].isin(value)].index
-                )
-                valid_inodes &= matching_inodes
+                mask &= self._database[key].isin(value).to_numpy()
                 continue
 
             if not isinstance(value, str):
@@ -608,26 +938,21 @@ class BidsArchitecture(BidsArchitectureMixin):
                         "digits and a wild card `*` separated by a `-`"
                     )
 
-                if all(conditions):
-                    col_numeric = pd.to_numeric(col, errors="coerce")
-                    start_val = (
-                        int(start) if start.isdigit() else col_numeric.min()
-                    )
-                    stop_val = (
-                        int(stop) if stop.isdigit() else col_numeric.max()
-                    )
-                    range_mask = (col_numeric >= start_val) & (
-                        col_numeric <= stop_val
-                    )
-                    print(range_mask)
-                    matching_inodes = set(self._database[range_mask].index)
-                    valid_inodes &= matching_inodes
+                col_numeric = self._to_numeric_column(key)
+                start_val = (
+                    int(start) if start.isdigit() else np.nanmin(col_numeric)
+                )
+                stop_val = (
+                    int(stop) if stop.isdigit() else np.nanmax(col_numeric)
+                )
+                mask &= (col_numeric >= start_val) & (
+                    col_numeric <= stop_val
+                )
 
             else:
-                matching_inodes = set(self._database[col == value].index)
-                valid_inodes &= matching_inodes
+                mask &= col.to_numpy() == value
 
-        return self._database.index.isin(valid_inodes)
+        return mask
 
     def select(
         self,
@@ -720,8 +1045,8 @@ class BidsArchitecture(BidsArchitectureMixin):
             setattr(self, "_database", self._database.loc[~mask])
             return self
 
-        new_instance = copy.deepcopy(self)
-        setattr(new_instance, "_database", new_instance._database.loc[~mask])
+        new_instance = copy.copy(self)
+        setattr(new_instance, "_database", self._database.loc[~mask])
         return new_instance
 
 
@@ -2,6 +2,7 @@
 
 import os
 import re
+from itertools import islice
 from pathlib import Path
 from typing import Optional, Set
 
@@ -26,6 +27,26 @@ VALID_COLUMNS = {
 }
 
 
+VALID_ENTITY_KEYS = frozenset(
+    {
+        "sub",
+        "ses",
+        "task",
+        "run",
+        "acq",
+        "recording",
+        "desc",
+        "space",
+    }
+)
+
+_VALID_DATATYPE_PATTERN = re.compile(r"^[a-z0-9]+$")
+_KEY_VALUE_PATTERN = re.compile(
+    r"(?P<key>[a-zA-Z0-9]+)-(?P<value>[a-zA-Z0-9]+)"
+)
+_PATH_PATTERN = re.compile(r"(sub|ses)-[\w\d]+")
+
+
 class BidsValidationError(Exception):
     """Exception raised for BIDS validation errors."""
 
@@ -72,23 +93,6 @@ def validate_bids_file(file: Path) -> bool:
     Raises:
         BidsValidationError: If validation fails
     """
-    valid_keys = {
-        "sub",
-        "ses",
-        "task",
-        "run",
-        "acq",
-        "recording",
-        "desc",
-        "space",
-    }
-
-    valid_datatype_pattern = re.compile(r"^[a-z0-9]+$")
-    key_value_pattern = re.compile(
-        r"(?P<key>[a-zA-Z0-9]+)-(?P<value>[a-zA-Z0-9]+)"
-    )
-    path_pattern = re.compile(r"(sub|ses)-[\w\d]+")
-
     errors = []
 
     filename = os.fspath(file.name) if file.suffix else None
@@ -112,14 +116,14 @@ def validate_bids_file(file: Path) -> bool:
         bids_path_parts = file.parent.parts[-2:]
         datatype = file.parts[-1]
 
-    if datatype and not valid_datatype_pattern.match(datatype):
+    if datatype and not _VALID_DATATYPE_PATTERN.match(datatype):
         errors.append(
             f"Invalid datatype: '{datatype}' should be a lowercase "
             "alphanumeric string."
         )
 
     for part in [bids_path_parts[0], bids_path_parts[1]]:
-        if not path_pattern.match(part):
+        if not _PATH_PATTERN.match(part):
             errors.append(
                 f"Invalid path component: '{part}' should match the pattern "
                 "'<key>-<value>' with key being 'sub' or 'ses'."
@@ -128,22 +132,26 @@ def validate_bids_file(file: Path) -> bool:
     if filename:
         name_parts = file.stem.split("_")
 
-        for i, part in enumerate(name_parts):
-            if i == len(name_parts) - 1:
-                continue
-
-            match = key_value_pattern.match(part)
-            if not match:
+        for part in islice(name_parts, len(name_parts) - 1):
+            # Cheap string checks stand in for the key-value regex: the
+            # key must be ASCII alphanumeric up to the first '-' and the
+            # value must start with an ASCII alphanumeric character.
+            key, sep, value = part.partition("-")
+            if not (
+                sep
+                and key.isascii()
+                and key.isalnum()
+                and value[:1].isascii()
+                and value[:1].isalnum()
+            ):
                 errors.append(
                     f"Invalid format in '{part}': should be '<key>-<value>'"
                 )
-            else:
-                key = match.group("key")
-                if key not in valid_keys:
-                    errors.append(
-                        f"Invalid key '{key}': must be one of"
-                        f"{sorted(valid_keys)}"
-                    )
+            elif key not in VALID_ENTITY_KEYS:
+                errors.append(
+                    f"Invalid key '{key}': must be one of"
+                    f"{sorted(VALID_ENTITY_KEYS)}"
+                )
 
     path_subject = (
         bids_path_parts[0].split("-")[1] if "-" in bids_path_parts[0] else None
@@ -199,9 +207,9 @@ def normalize_entity(
         return None
 
     value = value.strip()
-    prefix_pattern = f"^{prefix}-"
-    if re.match(prefix_pattern, value):
-        return value[len(prefix) + 1 :]
+    prefix = f"{prefix}-"
+    if value.startswith(prefix):
+        return value[len(prefix) :]
 
     return value
 
@@ -62,11 +62,9 @@ class BasePath:
         Returns:
             Base filename constructed from available attributes
         """
-        components = []
-        if self.subject:
-            components.append(f"sub-{self.subject}")
-        if self.session:
-            components.append(f"ses-{self.session}")
-        if self.suffix:
-            components.append(self.suffix)
-        return Path("_".join(components))
+        components = (
+            f"sub-{self.subject}" if self.subject else "",
+            f"ses-{self.session}" if self.session else "",
+            self.suffix if self.suffix else "",
+        )
+        return Path("_".join(filter(None, components)))
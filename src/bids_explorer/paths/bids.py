@@ -1,8 +1,10 @@
 """BIDS-compliant path handling."""
 
-import re
+import fnmatch
+import os
 from copy import copy
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, Union
 
@@ -12,6 +14,19 @@ from bids_explorer.architecture.validation import (
 )
 from bids_explorer.paths.base import BasePath
 
+# Filename entity keys mapped to BidsPath attribute names, built once at
+# import so `from_filename` dispatches with a single dict lookup per part.
+_ENTITY_KEY_TO_ATTR = {
+    "sub": "subject",
+    "ses": "session",
+    "task": "task",
+    "acq": "acquisition",
+    "run": "run",
+    "recording": "recording",
+    "space": "space",
+    "desc": "description",
+}
+
 
 @dataclass
 class BidsPath(BasePath):
@@ -70,9 +85,9 @@ class BidsPath(BasePath):
             return None
 
         value = value.strip()
-        prefix_pattern = f"^{prefix}-"
-        if re.match(prefix_pattern, value):
-            return value[len(prefix) + 1 :]
+        prefix = f"{prefix}-"
+        if value.startswith(prefix):
+            return value[len(prefix) :]
 
         return value
 
@@ -82,41 +97,39 @@ class BidsPath(BasePath):
         Returns:
             str: BIDS-compliant filename
         """
-        components = [f"sub-{self.subject}", f"ses-{self.session}"]
-
-        if self.task:
-            components.append(f"task-{self.task}")
-        if self.acquisition:
-            components.append(f"acq-{self.acquisition}")
-        if self.run:
-            components.append(f"run-{self.run}")
-        if self.recording:
-            components.append(f"recording-{self.recording}")
-        if self.space:
-            components.append(f"space-{self.space}")
-        if self.description:
-            components.append(f"desc-{self.description}")
-        if self.suffix:
-            components.append(self.suffix)
+        components = (
+            f"sub-{self.subject}",
+            f"ses-{self.session}",
+            f"task-{self.task}" if self.task else "",
+            f"acq-{self.acquisition}" if self.acquisition else "",
+            f"run-{self.run}" if self.run else "",
+            f"recording-{self.recording}" if self.recording else "",
+            f"space-{self.space}" if self.space else "",
+            f"desc-{self.description}" if self.description else "",
+            self.suffix if self.suffix else "",
+        )
 
         return Path("_".join(filter(None, components)))
 
-    @property
+    # Entities are normalized once in __post_init__ and not mutated
+    # afterwards, so the derived paths are memoized instead of rebuilding
+    # component lists and Path objects on every access.
+    @cached_property
     def basename(self) -> Path:
         """Get BIDS-compliant filename without extension."""
         return self._make_basename()
 
-    @property
+    @cached_property
     def filename(self) -> Path:
         """Get complete filename with extension."""
         return Path(f"{self.basename}{self.extension or ''}")
 
-    @property
+    @cached_property
     def relative_path(self) -> Path:
         """Get relative path."""
         return self._make_path(absolute=False)
 
-    @property
+    @cached_property
     def fullpath(self) -> Path:
         """Get complete path including filename."""
         path = self._make_path(absolute=bool(self.root))
@@ -131,6 +144,12 @@ class BidsPath(BasePath):
         Returns:
             True if path matches pattern, False otherwise
         """
+        if pattern == "*":
+            return True
+        if "/" not in pattern:
+            # Single-component patterns skip Path.match's per-call
+            # pattern parsing; fnmatch caches compiled translations.
+            return fnmatch.fnmatchcase(os.fspath(self.filename), pattern)
         return Path(self.filename).match(pattern)
 
     @classmethod
@@ -154,36 +173,22 @@ class BidsPath(BasePath):
         else:
             path = copy(file)
 
-        entities["datatype"] = path.parts[-1]
-        entities["session"] = path.parts[-2].split("-")[1]
-        entities["subject"] = path.parts[-3].split("-")[1]
+        parts = path.parts
+        entities["datatype"] = parts[-1]
+        entities["session"] = parts[-2].split("-")[1]
+        entities["subject"] = parts[-3].split("-")[1]
 
         name_parts = file.stem.split("_")
         for part in name_parts:
-            if "-" in part:
-                key, value = part.split("-", 1)
-                if key == "sub":
-                    entities["subject"] = value
-                elif key == "ses":
-                    entities["session"] = value
-                elif key == "task":
-                    entities["task"] = value
-                elif key == "acq":
-                    entities["acquisition"] = value
-                elif key == "run":
-                    entities["run"] = value
-                elif key == "recording":
-                    entities["recording"] = value
-                elif key == "space":
-                    entities["space"] = value
-                elif key == "desc":
-                    entities["description"] = value
+            key, sep, value = part.partition("-")
+            if sep and (attr := _ENTITY_KEY_TO_ATTR.get(key)) is not None:
+                entities[attr] = value
 
         entities["suffix"] = name_parts[-1]
         entities["extension"] = file.suffix
 
         # Get the root path (everything before subject directory)
-        root = Path(*path.parts[:-3]) if len(path.parts) > 3 else None
+        root = Path(*parts[:-3]) if len(parts) > 3 else None
 
         # Create instance with root path and entities
         return cls(root=root, **entities)
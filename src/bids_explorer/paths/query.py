@@ -1,11 +1,32 @@
 """Query functionality for BIDS paths."""
 
+import fnmatch
 import os
-import re  # Add this at the top of the file
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator, Optional
 
+# Wildcard-collapsing patterns compiled once at import; they squeeze
+# redundant '*'/'_' runs left over from absent optional entities.
+_COLLAPSE_OPTIONAL_RE = re.compile(
+    r"(\*+_)+|(_\*+)+|(\*+_\*+)+|(_\*+_)+|\*{2,}"
+)
+_COLLAPSE_FILENAME_RE = re.compile(r"(\*+_\*+)+|(_\*+_)+|\*{2,}")
+
+# Filename prefixes for the optional entities, shared by every query.
+_OPTIONAL_KEY_PREFIXES = {
+    "task": "task-",
+    "acquisition": "acq-",
+    "run": "run-",
+    "recording": "recording-",
+    "description": "desc-",
+}
+
+# Pattern produced by an unconstrained query; returned directly for the
+# common "scan everything" case without running the string builders.
+_ALL_WILDCARD_FILENAME = Path("sub-*_ses-*")
+
 
 @dataclass
 class BidsQuery:
@@ -52,20 +73,15 @@ class BidsQuery:
         condition_on_electrode_file = self.space is not None
         return condition_on_electrode_file or all(condition_regular_files)
 
-    def _format_optional_attrs(self, optional_attrs: list[str]) -> str | None:
+    def _format_optional_attrs(
+        self, optional_attrs: list[str], all_exist: bool
+    ) -> str | None:
         if self.space is not None:
             return f"space-{self.space}"
 
-        string_key_reference = {
-            "task": "task-",
-            "acquisition": "acq-",
-            "run": "run-",
-            "recording": "recording-",
-            "description": "desc-",
-        }
         str_attrs = "_".join(
             [
-                f"{string_key_reference.get(attr)}{getattr(self,attr)}"
+                f"{_OPTIONAL_KEY_PREFIXES[attr]}{getattr(self,attr)}"
                 if getattr(self, attr) is not None and attr != "space"
                 else "*"
                 for attr in optional_attrs
@@ -73,29 +89,19 @@ class BidsQuery:
         )
 
         for i in range(2):
-            str_attrs = re.sub(
-                r"(\*+_)+|(_\*+)+|(\*+_\*+)+|(_\*+_)+|\*{2,}", "*", str_attrs
-            )
+            str_attrs = _COLLAPSE_OPTIONAL_RE.sub("*", str_attrs)
 
-        if not self._all_optional_exist(optional_attrs=optional_attrs):
+        if not all_exist:
             str_attrs = f"*{str_attrs}*"
-            str_attrs = re.sub(
-                r"(\*+_)+|(_\*+)+|(\*+_\*+)+|(_\*+_)+|\*{2,}", "*", str_attrs
-            )
+            str_attrs = _COLLAPSE_OPTIONAL_RE.sub("*", str_attrs)
 
         if str_attrs == "*":
             return None
         else:
             return str_attrs
 
-    def _format_suffix_extension(
-        self, optional_attrs: list[str]
-    ) -> str | None:
-        if (
-            self.suffix is None
-            and self._all_optional_exist(optional_attrs)
-            and self.extension is None
-        ):
+    def _format_suffix_extension(self, all_exist: bool) -> str | None:
+        if self.suffix is None and all_exist and self.extension is None:
             return "*"
 
         elif self.suffix is not None and self.extension is None:
@@ -136,6 +142,22 @@ class BidsQuery:
 
     def _build_query_filename(self) -> Path:
         """Build the query."""
+        if not any(
+            (
+                self.subject,
+                self.session,
+                self.task,
+                self.acquisition,
+                self.run,
+                self.recording,
+                self.space,
+                self.description,
+                self.suffix,
+                self.extension,
+            )
+        ):
+            return _ALL_WILDCARD_FILENAME
+
         if self.space is not None:
             optional_attrs = ["space"]
         else:
@@ -148,8 +170,11 @@ class BidsQuery:
             ]
 
         formated_mandatory_str = self._format_mandatory_attrs()
-        formated_optional_str = self._format_optional_attrs(optional_attrs)
-        suffix_extension_str = self._format_suffix_extension(optional_attrs)
+        all_exist = self._all_optional_exist(optional_attrs)
+        formated_optional_str = self._format_optional_attrs(
+            optional_attrs, all_exist
+        )
+        suffix_extension_str = self._format_suffix_extension(all_exist)
         opt_suff_ext_str = self._format_opt_suffix_extension(
             suffix_extension_str, formated_optional_str
         )
@@ -169,8 +194,8 @@ class BidsQuery:
                 [formated_mandatory_str, opt_suff_ext_str]
             )
 
-        full_formated_str = re.sub(
-            r"(\*+_\*+)+|(_\*+_)+|\*{2,}", "*", full_formated_str
+        full_formated_str = _COLLAPSE_FILENAME_RE.sub(
+            "*", full_formated_str
         )
 
         return Path(full_formated_str)
@@ -203,6 +228,22 @@ class BidsQuery:
         Returns:
             Iterator yielding paths matching query pattern
 
+        Raises:
+            Exception: If root path is not defined
+        """
+        return (Path(entry.path) for entry in self.generate_entries())
+
+    def generate_entries(self) -> Iterator[os.DirEntry]:
+        """Generate iterator of matching directory entries.
+
+        Walks the tree with `os.scandir` so each yielded `os.DirEntry`
+        carries the metadata gathered during the directory listing.
+        Callers can read `entry.stat()` and `entry.inode()` without
+        issuing one `stat(2)` call per file.
+
+        Returns:
+            Iterator yielding `os.DirEntry` objects matching query pattern
+
         Raises:
             Exception: If root path is not defined
         """
@@ -211,4 +252,77 @@ class BidsQuery:
                 "Root was not defined. Please instantiate the object"
                 " by setting root to a desired path"
             )
-        return self.root.rglob(os.fspath(self.relative_path / self.filename))
+        pattern_parts = (self.relative_path / self.filename).parts
+        return self._scan_tree(os.fspath(self.root), pattern_parts)
+
+    def generate_partitions(self) -> Iterator[Iterator[os.DirEntry]]:
+        """Partition the query into one entry generator per top directory.
+
+        Splitting the walk at the `sub-*` level allows callers to scan
+        subject subtrees concurrently, which hides the latency of the
+        per-directory `readdir`/`stat` round-trips on network or SSD
+        filesystems.
+
+        Returns:
+            Iterator yielding one `os.DirEntry` iterator per top-level
+            directory of the query root.
+
+        Raises:
+            Exception: If root path is not defined
+        """
+        if not self.root:
+            raise Exception(
+                "Root was not defined. Please instantiate the object"
+                " by setting root to a desired path"
+            )
+        pattern_parts = (self.relative_path / self.filename).parts
+        try:
+            entries = os.scandir(os.fspath(self.root))
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and fnmatch.fnmatchcase(
+                    entry.name, pattern_parts[0]
+                ):
+                    yield self._scan_tree(entry.path, pattern_parts, depth=2)
+
+    def _scan_tree(
+        self,
+        directory: str,
+        pattern_parts: tuple[str, ...],
+        depth: int = 1,
+    ) -> Iterator[os.DirEntry]:
+        """Recursively scan a directory, yielding entries matching a pattern.
+
+        Each directory level is matched against its pattern component
+        before descending, so subtrees that cannot contain matching
+        files (e.g. other subjects when `subject` is fixed) are pruned
+        from the walk entirely.
+
+        Args:
+            directory: Directory to scan.
+            pattern_parts: Glob pattern components, one per path level
+                           below the query root.
+            depth: Current depth relative to the query root.
+
+        Returns:
+            Iterator yielding matching `os.DirEntry` objects.
+        """
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if depth < len(pattern_parts) and fnmatch.fnmatchcase(
+                        entry.name, pattern_parts[depth - 1]
+                    ):
+                        yield from self._scan_tree(
+                            entry.path, pattern_parts, depth + 1
+                        )
+                elif depth == len(pattern_parts) and fnmatch.fnmatchcase(
+                    entry.name, pattern_parts[-1]
+                ):
+                    yield entry
@@ -12,4 +12,5 @@ def get_database_property(database: pd.DataFrame, column: str) -> tuple:
     Returns:
         tuple: Sorted unique values from the column.
     """
-    return tuple(sorted(database[column].unique()))
+    values = database[column].dropna().drop_duplicates().sort_values()
+    return tuple(values.tolist())
@@ -1,5 +1,8 @@
 """Error handling utilities."""
 
+from typing import Sequence
+
+import numpy as np
 import pandas as pd
 
 from bids_explorer.architecture.mixins import BidsArchitectureMixin
@@ -32,10 +35,51 @@ def merge_error_logs(
     elif self._errors.empty and other._errors.empty:
         return self._errors
 
-    return pd.concat(
-        [
-            self._errors,
-            other._errors.loc[~other._errors.index.isin(self._errors.index)],
-        ],
-        copy=False,
-    )
+    new_labels = other._errors.index.difference(self._errors.index, sort=False)
+    other_new = other._errors.loc[new_labels]
+    if other_new.empty:
+        return self._errors
+
+    if self._errors.columns.equals(other_new.columns):
+        # Same schema: stack the underlying values directly, skipping
+        # pd.concat's axis alignment and block consolidation.
+        return pd.DataFrame(
+            np.vstack([self._errors.to_numpy(), other_new.to_numpy()]),
+            index=self._errors.index.append(other_new.index),
+            columns=self._errors.columns,
+        )
+
+    return pd.concat([self._errors, other_new])
+
+
+def merge_error_logs_many(
+    objects: Sequence[BidsArchitectureMixin],
+) -> pd.DataFrame:
+    """Merge error logs from several objects in a single pass.
+
+    Folding objects pairwise through `merge_error_logs` rehashes the
+    growing accumulator's index once per object; concatenating all logs
+    at once and deduplicating at the end keeps the work linear in the
+    total number of rows.
+
+    Args:
+        objects: Objects whose error logs should be combined. Earlier
+                 objects win when index labels collide.
+
+    Returns:
+        pd.DataFrame: A merged DataFrame containing combined error logs.
+
+    Raises:
+        AttributeError: If any object is missing error logs.
+    """
+    if any(not hasattr(obj, "_errors") for obj in objects):
+        raise AttributeError("One or more objects missing error logs")
+
+    frames = [obj._errors for obj in objects if not obj._errors.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+
+    merged = pd.concat(frames)
+    return merged.loc[~merged.index.duplicated(keep="first")]
@@ -1,11 +1,105 @@
 """Utility functions for parsing BIDS entities."""
+import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Union
+
+# Entity template and default patterns are built once at import;
+# parse_bids_filename copies the template instead of rebuilding the
+# dict literal on every call.
+_EMPTY_ENTITIES: Dict[str, Optional[str]] = {
+    "subject": None,
+    "session": None,
+    "datatype": None,
+    "task": None,
+    "run": None,
+    "recording": None,
+    "acquisition": None,
+    "space": None,
+    "description": None,
+    "suffix": None,
+    "extension": None,
+}
+
+# The default patterns all match a literal `<key>-` prefix, so parsing
+# with them reduces to one dict lookup per filename part.
+_DEFAULT_KEY_TO_ENTITY: Dict[str, str] = {
+    "sub": "subject",
+    "ses": "session",
+    "task": "task",
+    "run": "run",
+    "recording": "recording",
+    "acq": "acquisition",
+    "desc": "description",
+    "space": "space",
+}
+
+_DEFAULT_PATTERNS: Dict[str, str] = {
+    "subject": r"sub-([^_]+)",
+    "session": r"ses-([^_]+)",
+    "task": r"task-([^_]+)",
+    "run": r"run-([^_]+)",
+    "recording": r"recording-([^_]+)",
+    "acquisition": r"acq-([^_]+)",
+    "description": r"desc-([^_]+)",
+    "space": r"space-([^_]+)",
+    "suffix": r"[^_]+_([^_.]+)(?:\.|$)",
+}
+
+_DEFAULT_SUFFIX_RE = re.compile(_DEFAULT_PATTERNS["suffix"])
+
+
+@lru_cache(maxsize=65536)
+def _parse_default(path_str: str) -> Dict[str, Optional[str]]:
+    """Parse a path with the default patterns, memoized per path string.
+
+    Scans revisit the same paths during indexing and validation; caching
+    the parsed entities turns repeat parses into a single dict lookup.
+    Callers receive copies so the cached dict is never mutated.
+
+    Args:
+        path_str: String form of the BIDS file path.
+
+    Returns:
+        Dictionary containing parsed BIDS entities.
+    """
+    entities = _EMPTY_ENTITIES.copy()
+
+    # Split the path with plain string ops; building a Path object just
+    # to read .parts/.stem/.suffix costs more than the parse itself.
+    directory, _, filename = path_str.rpartition(os.sep)
+    if directory:
+        entities["datatype"] = directory.rpartition(os.sep)[2]
+
+    dot = filename.rfind(".")
+    if 0 < dot < len(filename) - 1:
+        name = filename[:dot]
+        # Extensions and suffixes repeat across an archive; interning
+        # shares one string object between all cached entries.
+        entities["extension"] = sys.intern(filename[dot:])
+    else:
+        name = filename
+        entities["extension"] = ""
+
+    # Every default pattern matches a literal `<key>-` prefix, so a
+    # partition plus one dict lookup replaces the regex loop.
+    for component in name.split("_"):
+        key, sep, value = component.partition("-")
+        entity = _DEFAULT_KEY_TO_ENTITY.get(key)
+        if sep and value and entity is not None:
+            entities[entity] = value
+
+    match = _DEFAULT_SUFFIX_RE.search(name)
+    if match:
+        entities["suffix"] = sys.intern(match.group(1))
+
+    return entities
 
 
 def parse_bids_filename(
-    file: Path, patterns: Optional[Dict[str, str]] = None
+    file: Union[str, Path], patterns: Optional[Dict[str, str]] = None
 ) -> Dict[str, Optional[str]]:
     """Parse BIDS entities from a filename.
 
@@ -14,7 +108,7 @@ def parse_bids_filename(
     as the entity value.
 
     Args:
-        file: Path object representing the BIDS file
+        file: Path of the BIDS file, as a string or Path object
         patterns: Optional dictionary of custom regex patterns for each entity.
                  Keys should be entity names (e.g., "subject", "session") and
                  values should be valid regex patterns. Each pattern should
@@ -26,44 +120,23 @@ def parse_bids_filename(
     Raises:
         re.error: If a regex pattern compilation fails
     """
-    entities: Dict[str, Optional[str]] = {
-        "subject": None,
-        "session": None,
-        "datatype": None,
-        "task": None,
-        "run": None,
-        "recording": None,
-        "acquisition": None,
-        "space": None,
-        "description": None,
-        "suffix": None,
-        "extension": None,
-    }
-
-    default_patterns: Dict[str, str] = {
-        "subject": r"sub-([^_]+)",
-        "session": r"ses-([^_]+)",
-        "task": r"task-([^_]+)",
-        "run": r"run-([^_]+)",
-        "recording": r"recording-([^_]+)",
-        "acquisition": r"acq-([^_]+)",
-        "description": r"desc-([^_]+)",
-        "space": r"space-([^_]+)",
-        "suffix": r"[^_]+_([^_.]+)(?:\.|$)",
-    }
-
-    parts: List[str] = list(file.parts)
+    if patterns is None:
+        return _parse_default(os.fspath(file)).copy()
+
+    if not isinstance(file, Path):
+        file = Path(file)
+
+    entities = _EMPTY_ENTITIES.copy()
+
+    parts = file.parts
     if len(parts) >= 2:
-        entities["datatype"] = str(parts[-2])
+        entities["datatype"] = parts[-2]
 
-    name: str = str(file.stem)
-    extension: str = str(file.suffix)
-    entities["extension"] = extension
-    active_patterns = patterns if patterns is not None else default_patterns
-    components = name.split("_")
+    name = file.stem
+    entities["extension"] = file.suffix
 
-    for component in components:
-        for entity, pattern in active_patterns.items():
+    for component in name.split("_"):
+        for entity, pattern in patterns.items():
             if entity == "suffix":
                 continue
             try:
@@ -73,20 +146,15 @@ def parse_bids_filename(
                     pattern = pattern + r"(?:_|$)"
                 match = re.match(pattern, component)
                 if match and match.groups():
-                    entities[entity] = str(match.group(1))
+                    entities[entity] = match.group(1)
             except re.error as e:
                 raise re.error(f"Invalid regex pattern for {entity}: {str(e)}")
 
-    if patterns is None or "suffix" in patterns:
-        suffix_pattern = (
-            patterns["suffix"]
-            if patterns and "suffix" in patterns
-            else default_patterns["suffix"]
-        )
+    if "suffix" in patterns:
         try:
-            match = re.search(suffix_pattern, name)
+            match = re.search(patterns["suffix"], name)
             if match and match.groups():
-                entities["suffix"] = str(match.group(1))
+                entities["suffix"] = match.group(1)
         except re.error as e:
             raise re.error(f"Invalid regex pattern for suffix: {str(e)}")
 
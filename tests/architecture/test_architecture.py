@@ -1,6 +1,9 @@
 """Tests for the BidsArchitecture class and related functionality."""
+import os
+from concurrent.futures import ThreadPoolExecutor
 from itertools import product
 from pathlib import Path
+from typing import Callable
 
 import numpy as np
 import pandas as pd
@@ -8,11 +11,30 @@ import pytest
 
 from bids_explorer.architecture.architecture import BidsArchitecture
 
+# Encoded once; the fixtures write the same few bytes into every file.
+HEADER_BYTES = b"Brain Vision Data Exchange Header File\n"
+INVALID_HEADER_BYTES = b"Brain Vision Data Exchange Header File Version 1.0\n"
 
-@pytest.fixture
-def bids_dataset(tmp_path: Path) -> Path:
-    """Create a temporary BIDS dataset structure."""
-    data_dir = tmp_path / "data"
+BidsFactory = Callable[[pd.DataFrame], BidsArchitecture]
+
+# Filename shapes written by bids_dataset; %-formatting one prebuilt
+# template is cheaper than evaluating an f-string per loop iteration.
+FILENAME_TEMPLATES = (
+    "sub-%s_ses-%s_task-aTask_%s.vhdr",
+    "sub-%s_ses-%s_task-aTask_run-%s_%s.vhdr",
+    "sub-%s_ses-%s_task-aTask_run-01_recording-%s_%s.vhdr",
+    "sub-%s_ses-%s_task-aTask_acq-%s_run-01_%s.vhdr",
+)
+
+
+@pytest.fixture(scope="session")
+def bids_dataset(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary BIDS dataset structure.
+
+    The tree is only ever read by the tests, so it is materialized once
+    per session instead of being rebuilt for every test.
+    """
+    data_dir = tmp_path_factory.mktemp("bids") / "data"
     subjects = ["001", "002", "003", "004", "005"]
     sessions = ["01", "02"]
     runs = ["01", "02"]
@@ -20,77 +42,125 @@ def bids_dataset(tmp_path: Path) -> Path:
     recordings = ["full", "partial"]
     datatypes = ["eeg", "multimodal", "pupil"]
 
+    # Create each directory once instead of re-running mkdir for every
+    # run/acquisition/recording combination living in the same folder.
+    for sub, ses, datatype in product(subjects, sessions, datatypes):
+        os.makedirs(
+            data_dir / f"sub-{sub}" / f"ses-{ses}" / datatype, exist_ok=True
+        )
+
+    file_paths = set()
     for sub, ses, datatype, run, acq, recording in product(
         subjects, sessions, datatypes, runs, acquisitions, recordings
     ):
         base_path = data_dir / f"sub-{sub}" / f"ses-{ses}" / datatype
-        base_path.mkdir(parents=True, exist_ok=True)
-
-        files = [
-            (
-                f"sub-{sub}_ses-{ses}_task-aTask_{datatype}.vhdr",
-                "Brain Vision Data Exchange Header File\n",
-            ),
-            (
-                f"sub-{sub}_ses-{ses}_task-aTask_run-{run}_{datatype}.vhdr",
-                "Brain Vision Data Exchange Header File\n",
-            ),
-            (
-                f"sub-{sub}_ses-{ses}_task-aTask_run-01_recording-{recording}_{datatype}.vhdr",
-                "Brain Vision Data Exchange Header File\n",
-            ),
-            (
-                f"sub-{sub}_ses-{ses}_task-aTask_acq-{acq}_run-01_{datatype}.vhdr",
-                "Brain Vision Data Exchange Header File\n",
-            ),
+
+        filenames = [
+            FILENAME_TEMPLATES[0] % (sub, ses, datatype),
+            FILENAME_TEMPLATES[1] % (sub, ses, run, datatype),
+            FILENAME_TEMPLATES[2] % (sub, ses, recording, datatype),
+            FILENAME_TEMPLATES[3] % (sub, ses, acq, datatype),
         ]
 
-        for filename, content in files:
-            file_path = base_path / filename
-            file_path.write_text(content)
+        file_paths.update(base_path / filename for filename in filenames)
+
+    def write_header(path: Path) -> None:
+        with open(path, "wb") as file:
+            file.write(HEADER_BYTES)
+
+    # The writes are independent, syscall-bound operations; overlapping
+    # them in a small thread pool shortens fixture setup.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write_header, file_paths))
 
     return data_dir
 
 
-@pytest.fixture
-def invalid_bids_dataset(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def invalid_bids_dataset(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a temporary BIDS dataset with invalid files."""
-    data_dir = tmp_path / "data"
+    data_dir = tmp_path_factory.mktemp("invalid_bids") / "data"
 
     invalid_files = [
-        (
-            "sub-001/ses-01/eeg/sub-001_ses-02_task-rest_eeg.vhdr",
-            "Brain Vision Data Exchange Header File Version 1.0\n",
-        ),
-        (
-            "sub-002/ses-01/eeg/sub-001_ses-01_task-rest_eeg.vhdr",
-            "Brain Vision Data Exchange Header File Version 1.0\n",
-        ),
-        (
-            "sub-003/ses-01/eeg/sub-003_sus-01_task-rest_eeg.vhdr",
-            "Brain Vision Data Exchange Header File Version 1.0\n",
-        ),
-        (
-            "sub-004/ses-01/eeg/sub-004_ses-01_run-badrun_eeg.vhdr",
-            "Brain Vision Data Exchange Header File Version 1.0\n",
-        ),
-        (
-            "sub-005/ses-01/eeg/sub-005_ses-01_task-invalid@task_eeg.vhdr",
-            "Brain Vision Data Exchange Header File Version 1.0\n",
-        ),
+        "sub-001/ses-01/eeg/sub-001_ses-02_task-rest_eeg.vhdr",
+        "sub-002/ses-01/eeg/sub-001_ses-01_task-rest_eeg.vhdr",
+        "sub-003/ses-01/eeg/sub-003_sus-01_task-rest_eeg.vhdr",
+        "sub-004/ses-01/eeg/sub-004_ses-01_run-badrun_eeg.vhdr",
+        "sub-005/ses-01/eeg/sub-005_ses-01_task-invalid@task_eeg.vhdr",
     ]
 
-    for filepath, content in invalid_files:
+    for filepath in invalid_files:
         full_path = data_dir / filepath
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content)
+        os.makedirs(full_path.parent, exist_ok=True)
+        with open(full_path, "wb") as file:
+            file.write(INVALID_HEADER_BYTES)
 
     return data_dir
 
 
-def test_architecture_database_creation(bids_dataset: Path) -> None:
+@pytest.fixture(scope="session")
+def arch(bids_dataset: Path) -> BidsArchitecture:
+    """Build a BidsArchitecture on the shared dataset once per session.
+
+    The tests only call read-only methods (`select` returns a fresh
+    instance), so the directory scan and filename parsing happen once
+    instead of once per test.
+    """
+    return BidsArchitecture(root=bids_dataset)
+
+
+@pytest.fixture(scope="module")
+def full_db_df() -> pd.DataFrame:
+    """Two-row frame with the canonical database columns.
+
+    Built once per module; the consuming tests only read it or hand it
+    to `_database`, which stores a reference.
+    """
+    return pd.DataFrame(
+        {
+            "root": ["path1", "path2"],
+            "subject": ["01", "02"],
+            "session": ["01", "02"],
+            "datatype": ["eeg", "eeg"],
+            "task": ["rest", "task"],
+            "run": ["01", "02"],
+            "acquisition": ["full", "full"],
+            "description": ["desc", "desc"],
+            "suffix": ["eeg", "eeg"],
+            "extension": [".vhdr", ".vhdr"],
+            "atime": [1000, 2000],
+            "mtime": [1000, 2000],
+            "ctime": [1000, 2000],
+            "filename": ["file1.vhdr", "file2.vhdr"],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def numeric_df() -> pd.DataFrame:
+    """Frame with one numeric-string column and one text column."""
+    return pd.DataFrame(
+        {
+            "numeric_col": ["1", "2", "3", "4", "5"],
+            "text_col": ["a", "b", "c", "d", "e"],
+        }
+    )
+
+
+@pytest.fixture
+def make_bids() -> BidsFactory:
+    """Return a factory building a BidsArchitecture around a frame."""
+
+    def factory(database: pd.DataFrame) -> BidsArchitecture:
+        bids = BidsArchitecture()
+        bids._database = database
+        return bids
+
+    return factory
+
+
+def test_architecture_database_creation(arch: BidsArchitecture) -> None:
     """Test database creation and basic properties."""
-    arch = BidsArchitecture(root=bids_dataset)
     assert not arch.database.empty
     assert arch.subjects == ["001", "002", "003", "004", "005"]
     assert arch.sessions == ["01", "02"]
@@ -102,7 +172,9 @@ def test_architecture_database_creation(bids_dataset: Path) -> None:
     assert arch.extensions == [".vhdr"]
 
 
-def test_architecture_select(bids_dataset: Path) -> None:
+def test_architecture_select(
+    arch: BidsArchitecture, bids_dataset: Path
+) -> None:
     """Test selection methods.
 
     References original test cases from:
@@ -111,8 +183,6 @@ def test_architecture_select(bids_dataset: Path) -> None:
     endLine: 173
     ```
     """
-    arch = BidsArchitecture(root=bids_dataset)
-
     result = arch.select(subject="001")
     assert not arch.database.empty
     assert result.subjects == ["001"]
@@ -163,33 +233,25 @@ def test_architecture_select(bids_dataset: Path) -> None:
     )
     assert result.database.empty
 
-    arch = BidsArchitecture(
+    filtered = BidsArchitecture(
         root=bids_dataset, subject="001", session="01", task="aTask", run="01"
     )
-    assert arch.subjects == ["001"]
-    assert arch.tasks == ["aTask"]
-    assert arch.runs == ["01"]
-    assert arch.sessions == ["01"]
-    assert len(arch) == 15
+    assert filtered.subjects == ["001"]
+    assert filtered.tasks == ["aTask"]
+    assert filtered.runs == ["01"]
+    assert filtered.sessions == ["01"]
+    assert len(filtered) == 15
 
 
-def test_architecture_set_operations(bids_dataset: Path) -> None:
+def test_architecture_set_operations(arch: BidsArchitecture) -> None:
     """Test set operations between BidsArchitecture instances."""
-    arch = BidsArchitecture(root=bids_dataset)
-    arch.database
-    arch1 = arch.select(subject=["001", "002"])
-    arch2 = arch.select(subject=["002", "004"])
-
-    print("\nDebug information:")
-    print(f"arch1 subjects: {arch1.subjects}")
-    print(f"arch1 database subjects:\n{arch1.database['subject'].unique()}")
-    print(f"\narch2 subjects: {arch2.subjects}")
-    print(f"arch2 database subjects:\n{arch2.database['subject'].unique()}")
+    # Narrow to the subjects of interest once, then slice the smaller
+    # frame instead of masking the full database twice.
+    base = arch.select(subject=["001", "002", "004"])
+    arch1 = base.select(subject=["001", "002"])
+    arch2 = base.select(subject=["002", "004"])
 
     union = arch1 + arch2
-    print(f"\nunion subjects: {union.subjects}")
-    print(f"union database subjects:\n{union.database['subject'].unique()}")
-
     assert union.subjects == ["001", "002", "004"]
 
     diff = arch1 - arch2
@@ -199,10 +261,8 @@ def test_architecture_set_operations(bids_dataset: Path) -> None:
     assert intersect.subjects == ["002"]
 
 
-def test_architecture_representation(bids_dataset: Path) -> None:
+def test_architecture_representation(arch: BidsArchitecture) -> None:
     """Test string representation of BidsArchitecture."""
-    arch = BidsArchitecture(root=bids_dataset)
-
     # Get the string representation
     repr_str = repr(arch)
 
@@ -244,32 +304,13 @@ def test_architecture_representation(bids_dataset: Path) -> None:
     assert repr(empty_arch) == empty_repr
 
 
-def test_getitem() -> None:
+def test_getitem(full_db_df: pd.DataFrame, make_bids: BidsFactory) -> None:
     """Test the __getitem__ functionality of BidsArchitecture."""
-    # Create test data
-    test_data = {
-        "root": ["path1", "path2"],
-        "subject": ["01", "02"],
-        "session": ["01", "02"],
-        "datatype": ["eeg", "eeg"],
-        "task": ["rest", "task"],
-        "run": ["01", "02"],
-        "acquisition": ["full", "full"],
-        "description": ["desc", "desc"],
-        "suffix": ["eeg", "eeg"],
-        "extension": [".vhdr", ".vhdr"],
-        "atime": [1000, 2000],
-        "mtime": [1000, 2000],
-        "ctime": [1000, 2000],
-        "filename": ["file1.vhdr", "file2.vhdr"],
-    }
-
-    # Create DataFrame with specific index
-    df = pd.DataFrame(test_data, index=[1, 2])
-
-    # Create BidsArchitecture instance and set the database
-    bids = BidsArchitecture()
-    bids._database = df
+    # Re-label the index so the test proves indexing is positional.
+    df = full_db_df.copy()
+    df.index = [1, 2]
+
+    bids = make_bids(df)
 
     # Test getting item by index
     result = bids[0]
@@ -288,7 +329,7 @@ def test_getitem() -> None:
         _ = bids[len(df)]
 
 
-def test_getitem_operations() -> None:
+def test_getitem_operations(make_bids: BidsFactory) -> None:
     """Test indexing operations on BidsArchitecture."""
     # Create test data
     test_data = pd.DataFrame(
@@ -312,8 +353,7 @@ def test_getitem_operations() -> None:
     )
 
     # Create BidsArchitecture instance
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test positive indexing
     first_item = bids[0]
@@ -336,35 +376,21 @@ def test_getitem_operations() -> None:
         bids[0] = pd.Series()
 
 
-def test_iteration_and_properties() -> None:
+def test_iteration_and_properties(
+    full_db_df: pd.DataFrame, make_bids: BidsFactory
+) -> None:
     """Test iteration and property setters of BidsArchitecture."""
-    # Create test data
-    test_data = pd.DataFrame(
-        {
-            "root": ["path1", "path2"],
-            "subject": ["01", "02"],
-            "session": ["01", "02"],
-            "datatype": ["eeg", "eeg"],
-            "task": ["rest", "task"],
-            "run": ["01", "02"],
-            "acquisition": ["full", "full"],
-            "description": ["desc", "desc"],
-            "suffix": ["eeg", "eeg"],
-            "extension": [".vhdr", ".vhdr"],
-            "atime": [1000, 2000],
-            "mtime": [1000, 2000],
-            "ctime": [1000, 2000],
-            "filename": ["file1.vhdr", "file2.vhdr"],
-        }
-    )
+    test_data = full_db_df
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
-    # Test __iter__
-    for i, item in bids:
-        assert item["subject"] == test_data.iloc[i]["subject"]
-        assert item["session"] == test_data.iloc[i]["session"]
+    # Test __iter__; itertuples avoids materializing a Series per row
+    # just to read the expected values.
+    for (_, item), expected in zip(
+        bids, test_data.itertuples(index=False)
+    ):
+        assert item["subject"] == expected.subject
+        assert item["session"] == expected.session
 
     # Verify length
     assert len(list(bids)) == 2
@@ -399,7 +425,7 @@ def test_iteration_and_properties() -> None:
         bids.database = invalid_df
 
 
-def test_get_unique_values() -> None:
+def test_get_unique_values(make_bids: BidsFactory) -> None:
     """Test getting unique values from database columns."""
     # Create test data with duplicates and None values
     test_data = pd.DataFrame(
@@ -418,8 +444,7 @@ def test_get_unique_values() -> None:
         }
     )
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test unique values with duplicates
     assert bids.subjects == ["01", "02", "03"]
@@ -440,38 +465,31 @@ def test_get_unique_values() -> None:
     assert empty_bids._get_unique_values("session") == []
 
 
-def test_get_range() -> None:
-    """Test the _get_range method with various inputs."""
-    test_data = pd.DataFrame(
-        {
-            "numeric_col": ["1", "2", "3", "4", "5"],
-        }
-    )
-
-    bids = BidsArchitecture()
-    bids._database = test_data
-
-    # Test with numeric strings
-    result = bids._get_range(test_data["numeric_col"], "2", "4")
-    assert list(result) == [False, True, True, False, False]
-
-    result = bids._get_range(test_data["numeric_col"], "02", "04")
-    assert list(result) == [False, True, True, False, False]
-
-    # Test with integers
-    result = bids._get_range(test_data["numeric_col"], 2, 4)
-    assert list(result) == [False, True, True, False, False]
-
-    # Test with None/wildcard for stop
-    result = bids._get_range(test_data["numeric_col"], None, "04")
-    assert list(result) == [True, True, True, False, False]
-
-    # Test with None/wildcard for start
-    result = bids._get_range(test_data["numeric_col"], "002", None)
-    assert list(result) == [False, True, True, True, True]
-
-
-def test_get_single_loc() -> None:
+@pytest.mark.parametrize(
+    ("start", "stop", "expected"),
+    [
+        ("2", "4", [False, True, True, False, False]),
+        ("02", "04", [False, True, True, False, False]),
+        (2, 4, [False, True, True, False, False]),
+        (None, "04", [True, True, True, False, False]),
+        ("002", None, [False, True, True, True, True]),
+    ],
+)
+def test_get_range(
+    numeric_df: pd.DataFrame,
+    make_bids: BidsFactory,
+    start: str | int | None,
+    stop: str | int | None,
+    expected: list[bool],
+) -> None:
+    """Test the _get_range method with numeric, padded and open bounds."""
+    bids = make_bids(numeric_df)
+
+    result = bids._get_range(numeric_df["numeric_col"], start, stop)
+    assert list(result) == expected
+
+
+def test_get_single_loc(make_bids: BidsFactory) -> None:
     """Test the _get_single_loc method."""
     test_data = pd.DataFrame(
         {
@@ -479,8 +497,7 @@ def test_get_single_loc() -> None:
         }
     )
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test existing value
     result = bids._get_single_loc(test_data["col"], "b")
@@ -494,7 +511,7 @@ def test_get_single_loc() -> None:
         assert not any(result)
 
 
-def test_is_numerical() -> None:
+def test_is_numerical(make_bids: BidsFactory) -> None:
     """Test the _is_numerical method."""
     test_data = pd.DataFrame(
         {
@@ -504,15 +521,14 @@ def test_is_numerical() -> None:
         }
     )
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     assert bids._is_numerical(test_data["numeric"]) is True
     assert bids._is_numerical(test_data["mixed"]) is False
     assert bids._is_numerical(test_data["non_numeric"]) is False
 
 
-def test_interpret_string() -> None:
+def test_interpret_string(make_bids: BidsFactory) -> None:
     """Test the _interpret_string method."""
     test_data = pd.DataFrame(
         {
@@ -520,8 +536,7 @@ def test_interpret_string() -> None:
         }
     )
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test range pattern
     result = bids._interpret_string(test_data["numeric_col"], "02-04")
@@ -564,7 +579,7 @@ def test_errors_display() -> None:
     assert list(bids.errors["error_type"].unique()) == ["type1", "type2"]
 
 
-def test_get_range_edge_cases() -> None:
+def test_get_range_edge_cases(make_bids: BidsFactory) -> None:
     """Test edge cases for the _get_range method."""
     test_data = pd.DataFrame(
         {
@@ -580,8 +595,7 @@ def test_get_range_edge_cases() -> None:
         }
     )
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test with non-numeric column
     with pytest.raises(ValueError):
@@ -600,7 +614,7 @@ def test_get_range_edge_cases() -> None:
     assert not any(result)  # Should return all False
 
 
-def test_get_single_loc_edge_cases() -> None:
+def test_get_single_loc_edge_cases(make_bids: BidsFactory) -> None:
     """Test edge cases for the _get_single_loc method."""
     test_data = pd.DataFrame(
         {
@@ -608,8 +622,7 @@ def test_get_single_loc_edge_cases() -> None:
         }
     )
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test with empty string
     result = bids._get_single_loc(test_data["col"], "")
@@ -626,17 +639,13 @@ def test_get_single_loc_edge_cases() -> None:
         assert not any(result)
 
 
-def test_interpret_string_edge_cases() -> None:
+def test_interpret_string_edge_cases(
+    numeric_df: pd.DataFrame, make_bids: BidsFactory
+) -> None:
     """Test edge cases for the _interpret_string method."""
-    test_data = pd.DataFrame(
-        {
-            "numeric_col": ["1", "2", "3", "4", "5"],
-            "text_col": ["a", "b", "c", "d", "e"],
-        }
-    )
+    test_data = numeric_df
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test invalid range format
     with pytest.raises(
@@ -700,7 +709,7 @@ def test_database_initialization() -> None:
         bids.database = invalid_df
 
 
-def test_select_edge_cases() -> None:
+def test_select_edge_cases(make_bids: BidsFactory) -> None:
     """Test edge cases in the select method."""
     test_data = pd.DataFrame(
         {
@@ -722,8 +731,7 @@ def test_select_edge_cases() -> None:
         }
     )
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test selection with empty string
     result = bids.select(subject="")
@@ -791,21 +799,17 @@ def test_property_edge_cases() -> None:
     assert bids.extensions == []
 
 
-def test_get_range_invalid_types() -> None:
+def test_get_range_invalid_types(
+    numeric_df: pd.DataFrame, make_bids: BidsFactory
+) -> None:
     """Test _get_range with invalid type conversions."""
-    test_data = pd.DataFrame(
-        {
-            "numeric_col": ["1", "2", "3", "4", "5"],
-            "invalid_col": ["a", "b", "c", "d", "e"],
-        }
-    )
+    test_data = numeric_df
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test with non-convertible string values
     with pytest.raises(ValueError):
-        bids._get_range(test_data["invalid_col"], "1", "3")
+        bids._get_range(test_data["text_col"], "1", "3")
 
     # Test with invalid types
     with pytest.raises(
@@ -824,12 +828,11 @@ def test_get_range_invalid_types() -> None:
         bids._get_range(test_data["numeric_col"], dict(), "3")  # type: ignore
 
 
-def test_get_single_loc_comprehensive() -> None:
+def test_get_single_loc_comprehensive(make_bids: BidsFactory) -> None:
     """Test _get_single_loc with various value types."""
     test_data = pd.DataFrame({"col": ["a", "b", "c", None, np.nan]})
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test with None value
     with pytest.warns(UserWarning):
@@ -842,7 +845,7 @@ def test_get_single_loc_comprehensive() -> None:
         assert not any(result)
 
 
-def test_create_mask() -> None:
+def test_create_mask(make_bids: BidsFactory) -> None:
     """Test the _create_mask method with various filtering scenarios."""
     test_data = pd.DataFrame(
         {
@@ -865,8 +868,7 @@ def test_create_mask() -> None:
         index=[1465, 2241, 3123],
     )
 
-    bids = BidsArchitecture()
-    bids._database = test_data
+    bids = make_bids(test_data)
 
     # Test basic single value filtering
     mask = bids._create_mask(subject="001")
@@ -3,7 +3,7 @@ import pandas as pd
 import pytest
 
 from bids_explorer.architecture.mixins import BidsArchitectureMixin
-from bids_explorer.utils.errors import merge_error_logs
+from bids_explorer.utils.errors import merge_error_logs, merge_error_logs_many
 
 
 class TestBidsArchitecture(BidsArchitectureMixin):
@@ -69,6 +69,45 @@ def test_merge_error_logs_empty() -> None:
     assert empty_merged.empty
 
 
+def test_merge_error_logs_many() -> None:
+    """Test merging error logs from several objects at once."""
+    errors1 = pd.DataFrame(
+        {
+            "error_message": ["Error 1"],
+            "filename": ["file1.txt"],
+        },
+        index=[1],
+    )
+    errors2 = pd.DataFrame(
+        {
+            "error_message": ["Error 2", "Error 3"],
+            "filename": ["file2.txt", "file3.txt"],
+        },
+        index=[2, 3],
+    )
+    errors3 = pd.DataFrame(
+        {
+            "error_message": ["Error 3 duplicate"],
+            "filename": ["file3.txt"],
+        },
+        index=[3],
+    )
+
+    merged = merge_error_logs_many(
+        [
+            TestBidsArchitecture(errors1),
+            TestBidsArchitecture(errors2),
+            TestBidsArchitecture(errors3),
+            TestBidsArchitecture(),
+        ]
+    )
+
+    assert len(merged) == 3
+    assert set(merged["error_message"]) == {"Error 1", "Error 2", "Error 3"}
+
+    assert merge_error_logs_many([TestBidsArchitecture()]).empty
+
+
 def test_merge_error_logs_missing_attributes() -> None:
     """Test merging error logs with missing attributes."""
 